@@ -0,0 +1,87 @@
+"""Numeric kernels backing the reporting models.
+
+``accumulate_matrix`` is compiled with Numba when it is installed. Without
+Numba an equivalent NumPy implementation is used, so the package keeps working
+with NumPy alone. Numba is only imported on the first call, so importing the
+package does not pay its start-up cost.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional
+
+import numpy as np
+
+
+# Integer encoding of a match result passed to ``accumulate_matrix``.
+OUTCOME_PLAYER_ONE_WIN = 0
+OUTCOME_PLAYER_TWO_WIN = 1
+OUTCOME_DRAW = 2
+OUTCOME_UNDECIDED = 3
+
+
+def _accumulate_matrix_loop(first, second, outcomes, weights, size):
+    matrix = np.zeros((size, size))
+    for k in range(first.shape[0]):
+        code = outcomes[k]
+        is_draw = code == OUTCOME_DRAW
+        first_wins = code == OUTCOME_PLAYER_ONE_WIN
+        second_wins = code == OUTCOME_PLAYER_TWO_WIN
+        matrix[first[k], second[k]] += weights[k] * (0.5 * is_draw + first_wins)
+        matrix[second[k], first[k]] += weights[k] * (0.5 * is_draw + second_wins)
+    return matrix
+
+
+def _accumulate_matrix_numpy(first, second, outcomes, weights, size):
+    is_draw = outcomes == OUTCOME_DRAW
+    first_wins = outcomes == OUTCOME_PLAYER_ONE_WIN
+    second_wins = outcomes == OUTCOME_PLAYER_TWO_WIN
+    matrix = np.zeros((size, size))
+    np.add.at(matrix, (first, second), weights * (0.5 * is_draw + first_wins))
+    np.add.at(matrix, (second, first), weights * (0.5 * is_draw + second_wins))
+    return matrix
+
+
+_accumulate_matrix: Optional[Callable[..., np.ndarray]] = None
+
+
+def _resolve_accumulate_matrix() -> Callable[..., np.ndarray]:
+    global _accumulate_matrix
+    if _accumulate_matrix is None:
+        try:
+            import numba
+        except ImportError:  # pragma: no cover - depends on the environment
+            _accumulate_matrix = _accumulate_matrix_numpy
+        else:
+            _accumulate_matrix = numba.njit(cache=True, boundscheck=False)(
+                _accumulate_matrix_loop
+            )
+    return _accumulate_matrix
+
+
+def accumulate_matrix(first, second, outcomes, weights, size):
+    """Sum weighted head-to-head points into a ``size`` x ``size`` matrix."""
+
+    return _resolve_accumulate_matrix()(first, second, outcomes, weights, size)
+
+
+def warm_up() -> None:
+    """Compile the kernels ahead of the first request that needs them."""
+
+    accumulate_matrix(
+        np.zeros(1, dtype=np.intp),
+        np.ones(1, dtype=np.intp),
+        np.zeros(1, dtype=np.int8),
+        np.ones(1, dtype=np.float64),
+        2,
+    )
+
+
+__all__ = [
+    "OUTCOME_DRAW",
+    "OUTCOME_PLAYER_ONE_WIN",
+    "OUTCOME_PLAYER_TWO_WIN",
+    "OUTCOME_UNDECIDED",
+    "accumulate_matrix",
+    "warm_up",
+]
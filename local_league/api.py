@@ -2,23 +2,43 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Any, Callable, List, Optional, TypeVar
 import uuid
 
-from fastapi import Depends, FastAPI, HTTPException, status
+import anyio
+import orjson
+from fastapi import FastAPI, HTTPException, Response, status
 from pydantic import BaseModel, Field
 
+from . import _kernels
 from .models import Season
 from .repository import LocalLeagueRepository
 
 
 DATABASE_PATH = os.getenv("LOCAL_LEAGUE_DB_PATH", "local_league.db")
+READ_POOL_SIZE = int(os.getenv("LOCAL_LEAGUE_READ_POOL_SIZE", "4"))
 
 app = FastAPI(title="Local League API")
 
-_repository = LocalLeagueRepository(DATABASE_PATH)
+_repository = LocalLeagueRepository(DATABASE_PATH, read_pool_size=READ_POOL_SIZE)
+
+# One slot per pooled connection (readers plus the writer). Requests beyond
+# that wait on the event loop instead of occupying a worker thread that would
+# only block on the connection pool.
+_database_limiter = anyio.CapacityLimiter(READ_POOL_SIZE + 1)
+
+_T = TypeVar("_T")
+
+
+async def _run_in_database_thread(func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """Run a blocking repository call without blocking the event loop."""
+
+    return await anyio.to_thread.run_sync(
+        functools.partial(func, *args, **kwargs), limiter=_database_limiter
+    )
 
 
 @app.on_event("startup")
@@ -26,10 +46,14 @@ def _initialize_schema() -> None:
     _repository.initialize_schema()
 
 
-def get_repository() -> LocalLeagueRepository:
-    """Provide the repository instance for FastAPI dependencies."""
+@app.on_event("startup")
+def _warm_up_kernels() -> None:
+    _kernels.warm_up()
+
 
-    return _repository
+@app.on_event("shutdown")
+def _close_repository() -> None:
+    _repository.close()
 
 
 class SeasonBase(BaseModel):
@@ -60,7 +84,8 @@ class SeasonResponse(BaseModel):
 
 
 def _season_to_response(season: Season) -> SeasonResponse:
-    return SeasonResponse(
+    # Seasons come from the repository already typed, so skip validation.
+    return SeasonResponse.model_construct(
         id=season.id,
         title=season.title,
         starts_on=season.starts_on,
@@ -79,20 +104,18 @@ def _validate_date_range(starts_on: date, ends_on: date) -> None:
 
 
 @app.get("/seasons", response_model=List[SeasonResponse])
-def list_seasons(
-    repository: LocalLeagueRepository = Depends(get_repository),
-) -> List[SeasonResponse]:
-    seasons = repository.list_seasons()
-    return [_season_to_response(season) for season in seasons]
+async def list_seasons() -> Response:
+    # Encode the stored rows directly instead of going through Season and
+    # SeasonResponse objects; response_model is kept for the OpenAPI schema.
+    records = await _run_in_database_thread(_repository.list_season_records)
+    return Response(orjson.dumps(records), media_type="application/json")
 
 
 @app.post("/seasons", response_model=SeasonResponse, status_code=status.HTTP_201_CREATED)
-def create_season(
-    payload: SeasonCreate,
-    repository: LocalLeagueRepository = Depends(get_repository),
-) -> SeasonResponse:
+async def create_season(payload: SeasonCreate) -> SeasonResponse:
     _validate_date_range(payload.starts_on, payload.ends_on)
-    season = repository.create_season(
+    season = await _run_in_database_thread(
+        _repository.create_season,
         title=payload.title,
         starts_on=payload.starts_on,
         ends_on=payload.ends_on,
@@ -102,23 +125,16 @@ def create_season(
 
 
 @app.get("/seasons/{season_id}", response_model=SeasonResponse)
-def get_season(
-    season_id: uuid.UUID,
-    repository: LocalLeagueRepository = Depends(get_repository),
-) -> SeasonResponse:
-    season = repository.get_season(season_id)
+async def get_season(season_id: uuid.UUID) -> SeasonResponse:
+    season = await _run_in_database_thread(_repository.get_season, season_id)
     if season is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
     return _season_to_response(season)
 
 
 @app.put("/seasons/{season_id}", response_model=SeasonResponse)
-def update_season(
-    season_id: uuid.UUID,
-    payload: SeasonUpdate,
-    repository: LocalLeagueRepository = Depends(get_repository),
-) -> SeasonResponse:
-    existing = repository.get_season(season_id)
+async def update_season(season_id: uuid.UUID, payload: SeasonUpdate) -> SeasonResponse:
+    existing = await _run_in_database_thread(_repository.get_season, season_id)
     if existing is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
 
@@ -133,18 +149,15 @@ def update_season(
 
     _validate_date_range(updated.starts_on, updated.ends_on)
 
-    saved = repository.update_season(updated)
+    saved = await _run_in_database_thread(_repository.update_season, updated)
     if saved is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
     return _season_to_response(saved)
 
 
 @app.delete("/seasons/{season_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_season(
-    season_id: uuid.UUID,
-    repository: LocalLeagueRepository = Depends(get_repository),
-) -> None:
-    deleted = repository.delete_season(season_id)
+async def delete_season(season_id: uuid.UUID) -> None:
+    deleted = await _run_in_database_thread(_repository.delete_season, season_id)
     if not deleted:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Season not found")
 
@@ -8,11 +8,25 @@ can be serialized to JSON or YAML when needed.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timezone
 from enum import Enum
 import uuid
 from typing import Dict, Iterable, List, Optional
 
+import numpy as np
+
+from ._kernels import (
+    OUTCOME_DRAW,
+    OUTCOME_PLAYER_ONE_WIN,
+    OUTCOME_PLAYER_TWO_WIN,
+    OUTCOME_UNDECIDED,
+    accumulate_matrix,
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
 
 class MatchOutcome(Enum):
     """Supported outcomes for a head-to-head match."""
@@ -22,18 +36,18 @@ class MatchOutcome(Enum):
     DRAW = "draw"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Player:
     """Represents a participant that can join multiple seasons."""
 
     id: uuid.UUID
     display_name: str
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
     is_active: bool = True
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SeasonParticipant:
     """Association between a season and a player."""
 
@@ -43,7 +57,7 @@ class SeasonParticipant:
     alias: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Season:
     """A month-long aggregation of events."""
 
@@ -51,11 +65,11 @@ class Season:
     title: str
     starts_on: date
     ends_on: date
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
     description: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventDay:
     """Represents the day-long tournament previously called a "フェス"."""
 
@@ -64,11 +78,11 @@ class EventDay:
     title: str
     held_on: date
     weight: float = 1.0
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Match:
     """A single head-to-head match record between two players."""
 
@@ -78,7 +92,7 @@ class Match:
     player_two_id: uuid.UUID
     outcome: MatchOutcome
     winner_id: Optional[uuid.UUID]
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
     notes: Optional[str] = None
 
     def points_for_player(self, player_id: uuid.UUID, weight: float = 1.0) -> float:
@@ -100,7 +114,7 @@ class Match:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class SeasonStanding:
     """Aggregate statistics for a player within a season."""
 
@@ -126,7 +140,17 @@ class SeasonStanding:
             self.losses += 1
 
 
-@dataclass
+def _outcome_code(outcome: MatchOutcome, player_one_won: bool, player_two_won: bool) -> int:
+    if outcome is MatchOutcome.DRAW:
+        return OUTCOME_DRAW
+    if player_one_won:
+        return OUTCOME_PLAYER_ONE_WIN
+    if player_two_won:
+        return OUTCOME_PLAYER_TWO_WIN
+    return OUTCOME_UNDECIDED
+
+
+@dataclass(slots=True)
 class SeasonMatrix:
     """Matrix representation used by the WebUI."""
 
@@ -145,24 +169,39 @@ class SeasonMatrix:
         """Construct a matrix of weighted points per head-to-head matchup."""
 
         player_order = list(player_ids)
-        rows: Dict[uuid.UUID, Dict[uuid.UUID, float]] = {
-            player_id: {opponent_id: 0.0 for opponent_id in player_order}
-            for player_id in player_order
-        }
-
+        index = {player_id: position for position, player_id in enumerate(player_order)}
         event_weights: Dict[uuid.UUID, float] = {event.id: event.weight for event in events}
 
+        # Undecided matches award nothing, so they are dropped before their
+        # players are looked up; either player may not be a participant.
+        decided = []
         for match in matches:
-            weight = event_weights.get(match.event_id, 1.0)
-            if match.outcome is MatchOutcome.DRAW:
-                rows[match.player_one_id][match.player_two_id] += weight * 0.5
-                rows[match.player_two_id][match.player_one_id] += weight * 0.5
-                continue
-
-            if match.winner_id == match.player_one_id:
-                rows[match.player_one_id][match.player_two_id] += weight
-            elif match.winner_id == match.player_two_id:
-                rows[match.player_two_id][match.player_one_id] += weight
+            code = _outcome_code(
+                match.outcome,
+                match.winner_id == match.player_one_id,
+                match.winner_id == match.player_two_id,
+            )
+            if code != OUTCOME_UNDECIDED:
+                decided.append((match, code))
+
+        count = len(decided)
+        first = np.fromiter(
+            (index[m.player_one_id] for m, _ in decided), dtype=np.intp, count=count
+        )
+        second = np.fromiter(
+            (index[m.player_two_id] for m, _ in decided), dtype=np.intp, count=count
+        )
+        weights = np.fromiter(
+            (event_weights.get(m.event_id, 1.0) for m, _ in decided), dtype=np.float64, count=count
+        )
+        outcomes = np.fromiter((code for _, code in decided), dtype=np.int8, count=count)
+
+        matrix = accumulate_matrix(first, second, outcomes, weights, len(player_order))
+
+        rows: Dict[uuid.UUID, Dict[uuid.UUID, float]] = {
+            player_id: dict(zip(player_order, values))
+            for player_id, values in zip(player_order, matrix.tolist())
+        }
 
         return cls(season_id=season_id, player_order=player_order, rows=rows)
 
@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
-from datetime import date, datetime
-from typing import Iterable, Iterator, List, Optional
+from datetime import date, datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
 import uuid
 
 from .models import (
@@ -20,107 +35,590 @@ from .models import (
 )
 
 
+_WRITER_PRAGMAS = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;
+PRAGMA foreign_keys = ON;
+"""
+
+_READER_PRAGMAS = """
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -64000;
+"""
+
+_DEFAULT_READ_POOL_SIZE = 4
+
+_STATEMENT_CACHE_SIZE = 256
+
+_T = TypeVar("_T")
+
+
+# Looked up per match row; a plain dict avoids the Enum constructor.
+_OUTCOMES = {outcome.value: outcome for outcome in MatchOutcome}
+
+# SQL statements are kept as module constants so every call passes the same
+# string and hits the connection's prepared statement cache.
+_PLAYER_COLUMNS = "id, display_name, created_at, is_active, notes"
+_SEASON_COLUMNS = "id, title, starts_on, ends_on, created_at, description"
+_SEASON_PARTICIPANT_COLUMNS = "season_id, player_id, seed, alias"
+_EVENT_COLUMNS = "id, season_id, title, held_on, weight, created_at, notes"
+_MATCH_COLUMNS = (
+    "id, event_id, player_one_id, player_two_id, outcome, winner_id, created_at, notes"
+)
+
+# Schema versions, stored in PRAGMA user_version:
+#   0 - IDs stored as 36-character TEXT (databases created before versioning)
+#   1 - IDs stored as 16-byte BLOBs
+_SCHEMA_VERSION = 1
+
+_SCHEMA_TABLES = (
+    """
+    CREATE TABLE IF NOT EXISTS players (
+        id BLOB PRIMARY KEY,
+        display_name TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        is_active INTEGER NOT NULL DEFAULT 1,
+        notes TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS seasons (
+        id BLOB PRIMARY KEY,
+        title TEXT NOT NULL,
+        starts_on TEXT NOT NULL,
+        ends_on TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        description TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS season_participants (
+        season_id BLOB NOT NULL,
+        player_id BLOB NOT NULL,
+        seed INTEGER,
+        alias TEXT,
+        PRIMARY KEY (season_id, player_id),
+        FOREIGN KEY (season_id) REFERENCES seasons (id) ON DELETE CASCADE,
+        FOREIGN KEY (player_id) REFERENCES players (id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS events (
+        id BLOB PRIMARY KEY,
+        season_id BLOB NOT NULL,
+        title TEXT NOT NULL,
+        held_on TEXT NOT NULL,
+        weight REAL NOT NULL DEFAULT 1.0,
+        created_at TEXT NOT NULL,
+        notes TEXT,
+        FOREIGN KEY (season_id) REFERENCES seasons (id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS matches (
+        id BLOB PRIMARY KEY,
+        event_id BLOB NOT NULL,
+        player_one_id BLOB NOT NULL,
+        player_two_id BLOB NOT NULL,
+        outcome TEXT NOT NULL,
+        winner_id BLOB,
+        created_at TEXT NOT NULL,
+        notes TEXT,
+        FOREIGN KEY (event_id) REFERENCES events (id) ON DELETE CASCADE,
+        FOREIGN KEY (player_one_id) REFERENCES players (id) ON DELETE CASCADE,
+        FOREIGN KEY (player_two_id) REFERENCES players (id) ON DELETE CASCADE,
+        FOREIGN KEY (winner_id) REFERENCES players (id)
+    )
+    """,
+)
+
+_SCHEMA_INDEXES = (
+    """
+    CREATE INDEX IF NOT EXISTS idx_participants_season
+        ON season_participants (season_id, seed)
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_events_season_held ON events (season_id, held_on)",
+    "CREATE INDEX IF NOT EXISTS idx_matches_event ON matches (event_id)",
+    """
+    CREATE INDEX IF NOT EXISTS idx_matches_players
+        ON matches (player_one_id, player_two_id)
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_matches_player_two ON matches (player_two_id)",
+)
+
+# UUID columns of each table, in foreign-key dependency order.
+_UUID_COLUMNS = {
+    "players": ("id",),
+    "seasons": ("id",),
+    "season_participants": ("season_id", "player_id"),
+    "events": ("id", "season_id"),
+    "matches": ("id", "event_id", "player_one_id", "player_two_id", "winner_id"),
+}
+
+_SQL_INSERT_PLAYER = """
+INSERT INTO players (id, display_name, created_at, is_active, notes)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_LIST_PLAYERS = f"SELECT {_PLAYER_COLUMNS} FROM players"
+
+_SQL_LIST_ACTIVE_PLAYERS = f"SELECT {_PLAYER_COLUMNS} FROM players WHERE is_active = 1"
+
+_SQL_SET_PLAYER_ACTIVE = "UPDATE players SET is_active = ? WHERE id = ?"
+
+_SQL_INSERT_SEASON = """
+INSERT INTO seasons (id, title, starts_on, ends_on, created_at, description)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_LIST_SEASONS = f"SELECT {_SEASON_COLUMNS} FROM seasons ORDER BY starts_on"
+
+_SQL_GET_SEASON = f"SELECT {_SEASON_COLUMNS} FROM seasons WHERE id = ?"
+
+_SQL_UPDATE_SEASON = """
+UPDATE seasons
+SET title = ?, starts_on = ?, ends_on = ?, description = ?
+WHERE id = ?
+"""
+
+_SQL_DELETE_SEASON = "DELETE FROM seasons WHERE id = ?"
+
+_SQL_LIST_SEASON_PARTICIPANTS = f"""
+SELECT {_SEASON_PARTICIPANT_COLUMNS}
+FROM season_participants
+WHERE season_id = ?
+ORDER BY seed
+"""
+
+_SQL_LIST_EVENTS = f"""
+SELECT {_EVENT_COLUMNS}
+FROM events
+WHERE season_id = ?
+ORDER BY held_on
+"""
+
+_SQL_LIST_MATCHES = f"SELECT {_MATCH_COLUMNS} FROM matches"
+
+_SQL_LIST_SEASON_MATCHES = """
+SELECT
+    m.id,
+    m.event_id,
+    m.player_one_id,
+    m.player_two_id,
+    m.outcome,
+    m.winner_id,
+    m.created_at,
+    m.notes
+FROM matches m
+JOIN events e ON e.id = m.event_id
+WHERE e.season_id = ?
+"""
+
+_SQL_SEASON_STANDINGS = """
+SELECT
+    p.player_id,
+    SUM(CASE WHEN m.outcome = 'draw' THEN 1 ELSE 0 END) AS draws,
+    SUM(
+        CASE WHEN m.outcome != 'draw' AND m.winner_id = p.player_id
+        THEN 1 ELSE 0 END
+    ) AS wins,
+    SUM(
+        CASE WHEN m.outcome != 'draw'
+            AND m.winner_id IS NOT NULL
+            AND m.winner_id != p.player_id
+        THEN 1 ELSE 0 END
+    ) AS losses,
+    SUM(
+        CASE
+            WHEN m.outcome = 'draw' THEN 0.5 * e.weight
+            WHEN m.winner_id = p.player_id THEN e.weight
+            ELSE 0
+        END
+    ) AS weighted_points
+FROM season_participants p
+LEFT JOIN events e ON e.season_id = p.season_id
+LEFT JOIN matches m
+    ON m.event_id = e.id
+    AND p.player_id IN (m.player_one_id, m.player_two_id)
+WHERE p.season_id = ?
+GROUP BY p.player_id
+ORDER BY p.seed
+"""
+
+# A true upsert rather than INSERT OR REPLACE, which deletes the existing row
+# (firing ON DELETE actions) before inserting the new one.
+_SQL_UPSERT_SEASON_PARTICIPANT = """
+INSERT INTO season_participants (season_id, player_id, seed, alias)
+VALUES (?, ?, ?, ?)
+ON CONFLICT (season_id, player_id) DO UPDATE
+SET seed = excluded.seed, alias = excluded.alias
+"""
+
+_SQL_INSERT_EVENT = """
+INSERT INTO events (id, season_id, title, held_on, weight, created_at, notes)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_MATCH = """
+INSERT INTO matches (
+    id,
+    event_id,
+    player_one_id,
+    player_two_id,
+    outcome,
+    winner_id,
+    created_at,
+    notes
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def _to_bool(value: int) -> bool:
     return bool(value)
 
 
 def _iso_datetime(value: datetime) -> str:
+    # Timestamps are stored as naive UTC with second precision.
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
     return value.replace(microsecond=0).isoformat(timespec="seconds")
 
 
+def _utc_timestamp(value: str) -> str:
+    # Stored timestamps are naive UTC; the "Z" suffix states that in JSON.
+    return f"{value}Z"
+
+
 def _parse_datetime(value: str) -> datetime:
-    return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value).replace(tzinfo=timezone.utc)
 
 
 def _iso_date(value: date) -> str:
     return value.isoformat()
 
 
+# The parsers below are memoized because the same IDs and dates recur across
+# many rows (e.g. every match of an event shares its event and player IDs).
+# Timestamps are nearly unique per row, so _parse_datetime is not cached.
+# The parsed values are immutable, so sharing them between rows is safe.
+@lru_cache(maxsize=4096)
 def _parse_date(value: str) -> date:
     return date.fromisoformat(value)
 
 
-def _as_uuid(value: str) -> uuid.UUID:
-    return uuid.UUID(value)
+@lru_cache(maxsize=4096)
+def _as_uuid(value: bytes) -> uuid.UUID:
+    return uuid.UUID(bytes=value)
 
 
-class LocalLeagueRepository:
-    """Persistence layer backed by SQLite."""
+def _season_participant_row(participant: SeasonParticipant) -> tuple:
+    return (
+        participant.season_id.bytes,
+        participant.player_id.bytes,
+        participant.seed,
+        participant.alias,
+    )
+
+
+def _event_row(event: EventDay) -> tuple:
+    return (
+        event.id.bytes,
+        event.season_id.bytes,
+        event.title,
+        _iso_date(event.held_on),
+        event.weight,
+        _iso_datetime(event.created_at),
+        event.notes,
+    )
+
+
+def _match_row(match: Match) -> tuple:
+    return (
+        match.id.bytes,
+        match.event_id.bytes,
+        match.player_one_id.bytes,
+        match.player_two_id.bytes,
+        match.outcome.value,
+        match.winner_id.bytes if match.winner_id else None,
+        _iso_datetime(match.created_at),
+        match.notes,
+    )
+
+
+def _text_uuid_to_bytes(value: Optional[str]) -> Optional[bytes]:
+    return None if value is None else uuid.UUID(value).bytes
+
+
+def _uses_text_ids(conn: sqlite3.Connection) -> bool:
+    columns = conn.execute("PRAGMA table_info(players)").fetchall()
+    return any(column["name"] == "id" and column["type"].upper() == "TEXT" for column in columns)
 
-    def __init__(self, path: str) -> None:
+
+def _migrate_text_ids(conn: sqlite3.Connection) -> None:
+    """Rewrite a version 0 database so every ID column holds UUID bytes.
+
+    SQLite cannot change a column's type, so each table is renamed aside,
+    recreated with the current schema and refilled with converted IDs. The
+    whole rewrite runs in one transaction with foreign keys disabled, and is
+    rolled back if any reference ends up dangling.
+    """
+
+    conn.create_function("uuid_bytes", 1, _text_uuid_to_bytes, deterministic=True)
+    # foreign_keys cannot be changed inside a transaction.
+    conn.execute("PRAGMA foreign_keys = OFF")
+    try:
+        conn.execute("BEGIN")
+        existing = {
+            row["name"]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        tables = [table for table in _UUID_COLUMNS if table in existing]
+        for table in tables:
+            conn.execute(f"ALTER TABLE {table} RENAME TO _legacy_{table}")
+        for statement in _SCHEMA_TABLES:
+            conn.execute(statement)
+        for table in tables:
+            columns = [
+                row["name"] for row in conn.execute(f"PRAGMA table_info(_legacy_{table})")
+            ]
+            values = [
+                f"uuid_bytes({column})" if column in _UUID_COLUMNS[table] else column
+                for column in columns
+            ]
+            conn.execute(
+                f"INSERT INTO {table} ({', '.join(columns)})"
+                f" SELECT {', '.join(values)} FROM _legacy_{table}"
+            )
+        for table in reversed(tables):
+            conn.execute(f"DROP TABLE _legacy_{table}")
+        if conn.execute("PRAGMA foreign_key_check").fetchone() is not None:
+            raise RuntimeError("Foreign key violations found while migrating TEXT IDs")
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.execute("PRAGMA foreign_keys = ON")
+
+
+# Row factories build domain objects straight from the cursor, so listings do
+# not materialize an intermediate ``sqlite3.Row`` per result. They index
+# columns by position and must be paired with an explicit column list.
+def _player_factory(cursor: sqlite3.Cursor, row: tuple) -> Player:
+    return Player(
+        id=_as_uuid(row[0]),
+        display_name=row[1],
+        created_at=_parse_datetime(row[2]),
+        is_active=_to_bool(row[3]),
+        notes=row[4],
+    )
+
+
+def _season_factory(cursor: sqlite3.Cursor, row: tuple) -> Season:
+    return Season(
+        id=_as_uuid(row[0]),
+        title=row[1],
+        starts_on=_parse_date(row[2]),
+        ends_on=_parse_date(row[3]),
+        created_at=_parse_datetime(row[4]),
+        description=row[5],
+    )
+
+
+def _season_record_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    return {
+        "id": _as_uuid(row[0]),
+        "title": row[1],
+        "starts_on": row[2],
+        "ends_on": row[3],
+        "created_at": _utc_timestamp(row[4]),
+        "description": row[5],
+    }
+
+
+def _season_participant_factory(cursor: sqlite3.Cursor, row: tuple) -> SeasonParticipant:
+    return SeasonParticipant(
+        season_id=_as_uuid(row[0]),
+        player_id=_as_uuid(row[1]),
+        seed=row[2],
+        alias=row[3],
+    )
+
+
+def _event_factory(cursor: sqlite3.Cursor, row: tuple) -> EventDay:
+    return EventDay(
+        id=_as_uuid(row[0]),
+        season_id=_as_uuid(row[1]),
+        title=row[2],
+        held_on=_parse_date(row[3]),
+        weight=row[4],
+        created_at=_parse_datetime(row[5]),
+        notes=row[6],
+    )
+
+
+def _match_factory(cursor: sqlite3.Cursor, row: tuple) -> Match:
+    return Match(
+        id=_as_uuid(row[0]),
+        event_id=_as_uuid(row[1]),
+        player_one_id=_as_uuid(row[2]),
+        player_two_id=_as_uuid(row[3]),
+        outcome=_OUTCOMES[row[4]],
+        winner_id=_as_uuid(row[5]) if row[5] else None,
+        created_at=_parse_datetime(row[6]),
+        notes=row[7],
+    )
+
+
+def _fetch_all(
+    conn: sqlite3.Connection,
+    factory: Callable[[sqlite3.Cursor, tuple], _T],
+    query: str,
+    params: Sequence[Any] = (),
+) -> List[_T]:
+    cursor = conn.cursor()
+    cursor.row_factory = factory
+    return cursor.execute(query, params).fetchall()
+
+
+class _ConnectionPool:
+    """One read-write connection plus a fixed-size pool of read-only ones.
+
+    SQLite in WAL mode allows readers to proceed while a write is in progress,
+    so reads are spread over up to ``read_size`` connections while writes are
+    serialized on the single writer. In-memory databases cannot be shared
+    between connections, so all reads go through the writer in that case.
+    """
+
+    def __init__(self, path: str, *, read_size: int = _DEFAULT_READ_POOL_SIZE) -> None:
         self._path = path
+        self._read_size = read_size
+        self._shared_reads = path == ":memory:" or path.startswith("file:") or read_size < 1
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_lock = threading.Lock()
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._opened_readers: List[sqlite3.Connection] = []
+        self._open_lock = threading.Lock()
+
+    def _open_writer(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._path, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_WRITER_PRAGMAS)
+        return conn
+
+    def _open_reader(self) -> sqlite3.Connection:
+        # The writer creates the database file and switches it to WAL mode,
+        # both of which a read-only connection cannot do itself.
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open_writer()
+        uri = f"{Path(self._path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(
+            uri, uri=True, check_same_thread=False, cached_statements=_STATEMENT_CACHE_SIZE
+        )
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_READER_PRAGMAS)
+        return conn
 
     @contextmanager
-    def _connection(self) -> Iterator[sqlite3.Connection]:
-        conn = sqlite3.connect(self._path)
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Yield the read-write connection, committing on success."""
+
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = self._open_writer()
+            conn = self._writer
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Yield a read-only connection, blocking while all are in use."""
+
+        if self._shared_reads:
+            with self.writer() as conn:
+                yield conn
+            return
+
+        conn = self._acquire_reader()
         try:
             yield conn
-            conn.commit()
         finally:
-            conn.close()
+            self._readers.put(conn)
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._open_lock:
+            if len(self._opened_readers) < self._read_size:
+                conn = self._open_reader()
+                self._opened_readers.append(conn)
+                return conn
+        return self._readers.get()
+
+    def close(self) -> None:
+        with self._open_lock:
+            for conn in self._opened_readers:
+                conn.close()
+            self._opened_readers.clear()
+            self._readers = queue.LifoQueue()
+        with self._write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+
+class LocalLeagueRepository:
+    """Persistence layer backed by SQLite."""
+
+    def __init__(self, path: str, *, read_pool_size: int = _DEFAULT_READ_POOL_SIZE) -> None:
+        self._pool = _ConnectionPool(path, read_size=read_pool_size)
+
+    def _write_connection(self) -> ContextManager[sqlite3.Connection]:
+        return self._pool.writer()
+
+    def _read_connection(self) -> ContextManager[sqlite3.Connection]:
+        return self._pool.reader()
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+
+        self._pool.close()
 
     def initialize_schema(self) -> None:
-        """Create tables if they do not already exist."""
-
-        with self._connection() as conn:
-            conn.executescript(
-                """
-                CREATE TABLE IF NOT EXISTS players (
-                    id TEXT PRIMARY KEY,
-                    display_name TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    is_active INTEGER NOT NULL DEFAULT 1,
-                    notes TEXT
-                );
-
-                CREATE TABLE IF NOT EXISTS seasons (
-                    id TEXT PRIMARY KEY,
-                    title TEXT NOT NULL,
-                    starts_on TEXT NOT NULL,
-                    ends_on TEXT NOT NULL,
-                    created_at TEXT NOT NULL,
-                    description TEXT
-                );
-
-                CREATE TABLE IF NOT EXISTS season_participants (
-                    season_id TEXT NOT NULL,
-                    player_id TEXT NOT NULL,
-                    seed INTEGER,
-                    alias TEXT,
-                    PRIMARY KEY (season_id, player_id),
-                    FOREIGN KEY (season_id) REFERENCES seasons (id) ON DELETE CASCADE,
-                    FOREIGN KEY (player_id) REFERENCES players (id) ON DELETE CASCADE
-                );
-
-                CREATE TABLE IF NOT EXISTS events (
-                    id TEXT PRIMARY KEY,
-                    season_id TEXT NOT NULL,
-                    title TEXT NOT NULL,
-                    held_on TEXT NOT NULL,
-                    weight REAL NOT NULL DEFAULT 1.0,
-                    created_at TEXT NOT NULL,
-                    notes TEXT,
-                    FOREIGN KEY (season_id) REFERENCES seasons (id) ON DELETE CASCADE
-                );
-
-                CREATE TABLE IF NOT EXISTS matches (
-                    id TEXT PRIMARY KEY,
-                    event_id TEXT NOT NULL,
-                    player_one_id TEXT NOT NULL,
-                    player_two_id TEXT NOT NULL,
-                    outcome TEXT NOT NULL,
-                    winner_id TEXT,
-                    created_at TEXT NOT NULL,
-                    notes TEXT,
-                    FOREIGN KEY (event_id) REFERENCES events (id) ON DELETE CASCADE,
-                    FOREIGN KEY (player_one_id) REFERENCES players (id) ON DELETE CASCADE,
-                    FOREIGN KEY (player_two_id) REFERENCES players (id) ON DELETE CASCADE,
-                    FOREIGN KEY (winner_id) REFERENCES players (id)
-                );
-                """
-            )
+        """Create tables if they do not already exist.
+
+        Databases from before schema versioning, which store IDs as TEXT, are
+        migrated in place. A database stamped with a newer schema version than
+        this code knows about is rejected.
+        """
+
+        with self._write_connection() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version > _SCHEMA_VERSION:
+                raise RuntimeError(
+                    f"Database schema version {version} is newer than supported "
+                    f"version {_SCHEMA_VERSION}"
+                )
+            if version == 0 and _uses_text_ids(conn):
+                _migrate_text_ids(conn)
+
+            conn.execute("BEGIN")
+            for statement in _SCHEMA_TABLES + _SCHEMA_INDEXES:
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
 
     # Player operations -------------------------------------------------
     def create_player(self, display_name: str, *, notes: Optional[str] = None) -> Player:
@@ -129,14 +627,11 @@ class LocalLeagueRepository:
         return player
 
     def add_player(self, player: Player) -> None:
-        with self._connection() as conn:
+        with self._write_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO players (id, display_name, created_at, is_active, notes)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_PLAYER,
                 (
-                    str(player.id),
+                    player.id.bytes,
                     player.display_name,
                     _iso_datetime(player.created_at),
                     int(player.is_active),
@@ -145,41 +640,21 @@ class LocalLeagueRepository:
             )
 
     def list_players(self, *, active_only: bool = False) -> List[Player]:
-        query = "SELECT * FROM players"
-        params: tuple = ()
-        if active_only:
-            query += " WHERE is_active = 1"
-            params = (1,)
-        with self._connection() as conn:
-            rows = conn.execute(query, params).fetchall()
-        return [
-            Player(
-                id=_as_uuid(row["id"]),
-                display_name=row["display_name"],
-                created_at=_parse_datetime(row["created_at"]),
-                is_active=_to_bool(row["is_active"]),
-                notes=row["notes"],
-            )
-            for row in rows
-        ]
+        query = _SQL_LIST_ACTIVE_PLAYERS if active_only else _SQL_LIST_PLAYERS
+        with self._read_connection() as conn:
+            return _fetch_all(conn, _player_factory, query)
 
     def set_player_active(self, player_id: uuid.UUID, *, is_active: bool) -> None:
-        with self._connection() as conn:
-            conn.execute(
-                "UPDATE players SET is_active = ? WHERE id = ?",
-                (int(is_active), str(player_id)),
-            )
+        with self._write_connection() as conn:
+            conn.execute(_SQL_SET_PLAYER_ACTIVE, (int(is_active), player_id.bytes))
 
     # Season operations -------------------------------------------------
     def add_season(self, season: Season) -> None:
-        with self._connection() as conn:
+        with self._write_connection() as conn:
             conn.execute(
-                """
-                INSERT INTO seasons (id, title, starts_on, ends_on, created_at, description)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_SEASON,
                 (
-                    str(season.id),
+                    season.id.bytes,
                     season.title,
                     _iso_date(season.starts_on),
                     _iso_date(season.ends_on),
@@ -189,19 +664,18 @@ class LocalLeagueRepository:
             )
 
     def list_seasons(self) -> List[Season]:
-        with self._connection() as conn:
-            rows = conn.execute("SELECT * FROM seasons ORDER BY starts_on").fetchall()
-        return [
-            Season(
-                id=_as_uuid(row["id"]),
-                title=row["title"],
-                starts_on=_parse_date(row["starts_on"]),
-                ends_on=_parse_date(row["ends_on"]),
-                created_at=_parse_datetime(row["created_at"]),
-                description=row["description"],
-            )
-            for row in rows
-        ]
+        with self._read_connection() as conn:
+            return _fetch_all(conn, _season_factory, _SQL_LIST_SEASONS)
+
+    def list_season_records(self) -> List[Dict[str, Any]]:
+        """Return seasons as orjson-ready dictionaries ordered by start date.
+
+        IDs are ``uuid.UUID`` values, and dates and timestamps are ISO
+        strings, so the records skip building ``Season`` objects.
+        """
+
+        with self._read_connection() as conn:
+            return _fetch_all(conn, _season_record_factory, _SQL_LIST_SEASONS)
 
     def create_season(
         self,
@@ -222,64 +696,41 @@ class LocalLeagueRepository:
         return season
 
     def add_season_participant(self, participant: SeasonParticipant) -> None:
-        with self._connection() as conn:
-            conn.execute(
-                """
-                INSERT OR REPLACE INTO season_participants (season_id, player_id, seed, alias)
-                VALUES (?, ?, ?, ?)
-                """,
-                (
-                    str(participant.season_id),
-                    str(participant.player_id),
-                    participant.seed,
-                    participant.alias,
-                ),
-            )
+        with self._write_connection() as conn:
+            conn.execute(_SQL_UPSERT_SEASON_PARTICIPANT, _season_participant_row(participant))
+
+    def add_season_participants(self, participants: Iterable[SeasonParticipant]) -> None:
+        """Insert several participants in a single transaction."""
+
+        rows = [_season_participant_row(participant) for participant in participants]
+        with self._write_connection() as conn:
+            conn.executemany(_SQL_UPSERT_SEASON_PARTICIPANT, rows)
 
     def list_season_participants(self, season_id: uuid.UUID) -> List[SeasonParticipant]:
-        with self._connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM season_participants WHERE season_id = ? ORDER BY seed",
-                (str(season_id),),
-            ).fetchall()
-        return [
-            SeasonParticipant(
-                season_id=_as_uuid(row["season_id"]),
-                player_id=_as_uuid(row["player_id"]),
-                seed=row["seed"],
-                alias=row["alias"],
+        with self._read_connection() as conn:
+            return _fetch_all(
+                conn,
+                _season_participant_factory,
+                _SQL_LIST_SEASON_PARTICIPANTS,
+                (season_id.bytes,),
             )
-            for row in rows
-        ]
 
     def get_season(self, season_id: uuid.UUID) -> Optional[Season]:
-        with self._connection() as conn:
-            row = conn.execute("SELECT * FROM seasons WHERE id = ?", (str(season_id),)).fetchone()
-        if row is None:
-            return None
-        return Season(
-            id=_as_uuid(row["id"]),
-            title=row["title"],
-            starts_on=_parse_date(row["starts_on"]),
-            ends_on=_parse_date(row["ends_on"]),
-            created_at=_parse_datetime(row["created_at"]),
-            description=row["description"],
-        )
+        with self._read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = _season_factory
+            return cursor.execute(_SQL_GET_SEASON, (season_id.bytes,)).fetchone()
 
     def update_season(self, season: Season) -> Optional[Season]:
-        with self._connection() as conn:
+        with self._write_connection() as conn:
             cursor = conn.execute(
-                """
-                UPDATE seasons
-                SET title = ?, starts_on = ?, ends_on = ?, description = ?
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_SEASON,
                 (
                     season.title,
                     _iso_date(season.starts_on),
                     _iso_date(season.ends_on),
                     season.description,
-                    str(season.id),
+                    season.id.bytes,
                 ),
             )
 
@@ -288,28 +739,21 @@ class LocalLeagueRepository:
         return season
 
     def delete_season(self, season_id: uuid.UUID) -> bool:
-        with self._connection() as conn:
-            cursor = conn.execute("DELETE FROM seasons WHERE id = ?", (str(season_id),))
+        with self._write_connection() as conn:
+            cursor = conn.execute(_SQL_DELETE_SEASON, (season_id.bytes,))
         return cursor.rowcount > 0
 
     # Event operations --------------------------------------------------
     def add_event(self, event: EventDay) -> None:
-        with self._connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO events (id, season_id, title, held_on, weight, created_at, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(event.id),
-                    str(event.season_id),
-                    event.title,
-                    _iso_date(event.held_on),
-                    event.weight,
-                    _iso_datetime(event.created_at),
-                    event.notes,
-                ),
-            )
+        with self._write_connection() as conn:
+            conn.execute(_SQL_INSERT_EVENT, _event_row(event))
+
+    def add_events(self, events: Iterable[EventDay]) -> None:
+        """Insert several events in a single transaction."""
+
+        rows = [_event_row(event) for event in events]
+        with self._write_connection() as conn:
+            conn.executemany(_SQL_INSERT_EVENT, rows)
 
     def create_event(
         self,
@@ -332,51 +776,20 @@ class LocalLeagueRepository:
         return event
 
     def list_events(self, season_id: uuid.UUID) -> List[EventDay]:
-        with self._connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM events WHERE season_id = ? ORDER BY held_on",
-                (str(season_id),),
-            ).fetchall()
-        return [
-            EventDay(
-                id=_as_uuid(row["id"]),
-                season_id=_as_uuid(row["season_id"]),
-                title=row["title"],
-                held_on=_parse_date(row["held_on"]),
-                weight=row["weight"],
-                created_at=_parse_datetime(row["created_at"]),
-                notes=row["notes"],
-            )
-            for row in rows
-        ]
+        with self._read_connection() as conn:
+            return _fetch_all(conn, _event_factory, _SQL_LIST_EVENTS, (season_id.bytes,))
 
     # Match operations --------------------------------------------------
     def add_match(self, match: Match) -> None:
-        with self._connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO matches (
-                    id,
-                    event_id,
-                    player_one_id,
-                    player_two_id,
-                    outcome,
-                    winner_id,
-                    created_at,
-                    notes
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    str(match.id),
-                    str(match.event_id),
-                    str(match.player_one_id),
-                    str(match.player_two_id),
-                    match.outcome.value,
-                    str(match.winner_id) if match.winner_id else None,
-                    _iso_datetime(match.created_at),
-                    match.notes,
-                ),
-            )
+        with self._write_connection() as conn:
+            conn.execute(_SQL_INSERT_MATCH, _match_row(match))
+
+    def add_matches(self, matches: Iterable[Match]) -> None:
+        """Insert several matches in a single transaction."""
+
+        rows = [_match_row(match) for match in matches]
+        with self._write_connection() as conn:
+            conn.executemany(_SQL_INSERT_MATCH, rows)
 
     def create_match(
         self,
@@ -401,26 +814,17 @@ class LocalLeagueRepository:
         return match
 
     def list_matches_for_events(self, event_ids: Iterable[uuid.UUID]) -> List[Match]:
-        ids = [str(event_id) for event_id in event_ids]
+        ids = [event_id.bytes for event_id in event_ids]
         if not ids:
             return []
         placeholders = ",".join("?" for _ in ids)
-        query = f"SELECT * FROM matches WHERE event_id IN ({placeholders})"
-        with self._connection() as conn:
-            rows = conn.execute(query, ids).fetchall()
-        return [
-            Match(
-                id=_as_uuid(row["id"]),
-                event_id=_as_uuid(row["event_id"]),
-                player_one_id=_as_uuid(row["player_one_id"]),
-                player_two_id=_as_uuid(row["player_two_id"]),
-                outcome=MatchOutcome(row["outcome"]),
-                winner_id=_as_uuid(row["winner_id"]) if row["winner_id"] else None,
-                created_at=_parse_datetime(row["created_at"]),
-                notes=row["notes"],
-            )
-            for row in rows
-        ]
+        query = f"{_SQL_LIST_MATCHES} WHERE event_id IN ({placeholders})"
+        with self._read_connection() as conn:
+            return _fetch_all(conn, _match_factory, query, ids)
+
+    def list_matches_for_season(self, season_id: uuid.UUID) -> List[Match]:
+        with self._read_connection() as conn:
+            return _fetch_all(conn, _match_factory, _SQL_LIST_SEASON_MATCHES, (season_id.bytes,))
 
     # Reporting helpers -------------------------------------------------
     def compute_season_matrix(self, season_id: uuid.UUID) -> SeasonMatrix:
@@ -431,26 +835,25 @@ class LocalLeagueRepository:
         participants = self.list_season_participants(season_id)
         player_ids = [participant.player_id for participant in participants]
         events = self.list_events(season_id)
-        matches = self.list_matches_for_events(event.id for event in events)
+        matches = self.list_matches_for_season(season_id)
         return SeasonMatrix.build(season_id, player_ids, events, matches)
 
     def compute_season_standings(self, season_id: uuid.UUID) -> List[SeasonStanding]:
-        events = self.list_events(season_id)
-        matches = self.list_matches_for_events(event.id for event in events)
-
-        standings = {
-            participant.player_id: SeasonStanding(season_id=season_id, player_id=participant.player_id)
-            for participant in self.list_season_participants(season_id)
-        }
+        """Aggregate per-player results for a season in a single query."""
 
-        event_weights = {event.id: event.weight for event in events}
-        for match in matches:
-            weight = event_weights.get(match.event_id, 1.0)
-            for player_id, standing in standings.items():
-                if player_id in (match.player_one_id, match.player_two_id):
-                    standing.record_match(match, weight)
-
-        return list(standings.values())
+        with self._read_connection() as conn:
+            rows = conn.execute(_SQL_SEASON_STANDINGS, (season_id.bytes,)).fetchall()
+        return [
+            SeasonStanding(
+                season_id=season_id,
+                player_id=_as_uuid(row["player_id"]),
+                wins=row["wins"],
+                losses=row["losses"],
+                draws=row["draws"],
+                weighted_points=float(row["weighted_points"]),
+            )
+            for row in rows
+        ]
 
 
 __all__ = ["LocalLeagueRepository"]